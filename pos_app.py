@@ -2,15 +2,32 @@ import csv
 import json
 import os
 import subprocess
+import time
 import tkinter as tk
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import cached_property
 from tkinter import filedialog, messagebox, ttk
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 STATE_FILE = "app_state.json"
+PRODUCTS_FILE = "products.jsonl"
 TICKET_DIR = "tickets"
+PRODUCT_PAGE_SIZE = 500
+PRODUCT_BATCH_SIZE = 250
+SAVE_DELAY_MS = 500
+IO_POLL_MS = 50
+PRINTERS_CACHE_TTL = 60.0
+LPSTAT_TIMEOUT = 5
+LPR_TIMEOUT = 30
 
 
 @dataclass
@@ -20,6 +37,10 @@ class Product:
     barcode: str
     price: float
 
+    @cached_property
+    def price_str(self) -> str:
+        return f"${self.price:,.2f}"
+
 
 class POSApp(tk.Tk):
     def __init__(self) -> None:
@@ -29,31 +50,106 @@ class POSApp(tk.Tk):
 
         self.products: List[Product] = []
         self.current_sale: List[Tuple[Product, int]] = []
-        self.session_sales: List[List[Tuple[Product, int]]] = []
         self.cash_open: bool = False
         self.printer_name: Optional[str] = None
+        self._tree_rows: int = 0
+        self._tree_limit: int = PRODUCT_PAGE_SIZE
+        self._tree_fill_id: Optional[str] = None
+        self._sale_total: float = 0.0
+        self._last_total_str: str = ""
+        self._session_qty: Dict[str, int] = defaultdict(int)
+        self._session_total: float = 0.0
+        self._save_after_id: Optional[str] = None
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        # Printer probes get their own worker so a stalled lpstat never delays tickets.
+        self._printer_pool = ThreadPoolExecutor(max_workers=1)
+        self._printers_cache: Optional[Tuple[float, List[str]]] = None
+        self._pending_jobs: int = 0
+        self._closing: bool = False
 
         self._load_state()
         self._build_ui()
+        # Warm the printer cache so the printer dialog opens without waiting on lpstat.
+        self._printer_pool.submit(self._list_printers)
 
     # ---------- State handling ----------
     def _load_state(self) -> None:
+        data = {}
         if os.path.exists(STATE_FILE):
             try:
                 with open(STATE_FILE, "r", encoding="utf-8") as fh:
                     data = json.load(fh)
-                self.products = [Product(**p) for p in data.get("products", [])]
                 self.printer_name = data.get("printer_name")
             except Exception:
-                messagebox.showwarning("Estado", "No se pudo cargar el estado previo. Se iniciará limpio.")
+                data = {}
+                messagebox.showwarning("Estado", "No se pudo cargar la configuración previa. Se usarán valores por defecto.")
+
+        if os.path.exists(PRODUCTS_FILE):
+            self.products = self._read_products()
+        elif data.get("products"):
+            # Older versions kept the catalog inside the state file.
+            try:
+                self.products = [Product(**p) for p in data["products"]]
+            except TypeError:
+                messagebox.showwarning("Estado", "No se pudo cargar el catálogo previo. Se iniciará limpio.")
+                return
+            self._append_products(self.products)
+
+    def _read_products(self) -> List[Product]:
+        # A crash mid-append can leave a torn last line; skip bad lines
+        # instead of discarding the whole catalog.
+        loads = orjson.loads if orjson is not None else json.loads
+        products: List[Product] = []
+        skipped = 0
+        try:
+            with open(PRODUCTS_FILE, "r", encoding="utf-8", errors="replace") as fh:
+                for line in fh:
+                    if not line.strip():
+                        continue
+                    try:
+                        products.append(Product(**loads(line)))
+                    except (TypeError, ValueError):
+                        skipped += 1
+        except OSError:
+            messagebox.showwarning("Estado", "No se pudo leer el catálogo de productos. Se iniciará limpio.")
+            return []
+        if skipped:
+            messagebox.showwarning("Estado", f"Líneas dañadas omitidas del catálogo de productos: {skipped}")
+        return products
+
+    def _append_products(self, products: List[Product]) -> None:
+        with open(PRODUCTS_FILE, "a+b") as fh:
+            # Terminate a torn last line so new products don't get glued to it.
+            size = fh.seek(0, os.SEEK_END)
+            if size:
+                fh.seek(size - 1)
+                if fh.read(1) != b"\n":
+                    fh.write(b"\n")
+            for p in products:
+                if orjson is not None:
+                    line = orjson.dumps(asdict(p))
+                else:
+                    line = json.dumps(asdict(p), ensure_ascii=False).encode("utf-8")
+                fh.write(line + b"\n")
+
+    def _schedule_save(self) -> None:
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(SAVE_DELAY_MS, self._save_state)
 
     def _save_state(self) -> None:
-        data = {
-            "products": [asdict(p) for p in self.products],
-            "printer_name": self.printer_name,
-        }
-        with open(STATE_FILE, "w", encoding="utf-8") as fh:
-            json.dump(data, fh, ensure_ascii=False, indent=2)
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        data = {"printer_name": self.printer_name}
+        tmp_file = STATE_FILE + ".tmp"
+        if orjson is not None:
+            with open(tmp_file, "wb") as fh:
+                fh.write(orjson.dumps(data))
+        else:
+            with open(tmp_file, "w", encoding="utf-8") as fh:
+                json.dump(data, fh, ensure_ascii=False)
+        os.replace(tmp_file, STATE_FILE)
 
     # ---------- UI ----------
     def _build_ui(self) -> None:
@@ -81,12 +177,12 @@ class POSApp(tk.Tk):
         body.rowconfigure(0, weight=1)
 
         # Products panel
-        products_frame = ttk.LabelFrame(body, text="Productos")
-        products_frame.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-        products_frame.columnconfigure(0, weight=1)
-        products_frame.rowconfigure(0, weight=1)
+        self.products_frame = ttk.LabelFrame(body, text="Productos")
+        self.products_frame.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
+        self.products_frame.columnconfigure(0, weight=1)
+        self.products_frame.rowconfigure(0, weight=1)
 
-        self.product_tree = ttk.Treeview(products_frame, columns=("ref", "desc", "bar", "price"), show="headings")
+        self.product_tree = ttk.Treeview(self.products_frame, columns=("ref", "desc", "bar", "price"), show="headings")
         for col, title, width in [
             ("ref", "Referencia", 120),
             ("desc", "Descripción", 250),
@@ -97,9 +193,9 @@ class POSApp(tk.Tk):
             self.product_tree.column(col, width=width, anchor="w")
         self.product_tree.grid(row=0, column=0, sticky="nsew")
 
-        prod_scroll = ttk.Scrollbar(products_frame, orient="vertical", command=self.product_tree.yview)
-        self.product_tree.configure(yscrollcommand=prod_scroll.set)
-        prod_scroll.grid(row=0, column=1, sticky="ns")
+        self.prod_scroll = ttk.Scrollbar(self.products_frame, orient="vertical", command=self.product_tree.yview)
+        self.product_tree.configure(yscrollcommand=self._on_product_scroll)
+        self.prod_scroll.grid(row=0, column=1, sticky="ns")
 
         # Sale panel
         sale_frame = ttk.LabelFrame(body, text="Venta actual")
@@ -153,11 +249,11 @@ class POSApp(tk.Tk):
             except StopIteration:
                 messagebox.showerror("Importación", "El archivo está vacío")
                 return
-            sample_rows = [row for _, row in zip(range(3), reader)]
+            rows = list(reader)
 
-        self._open_mapping_dialog(csv_path, headers, sample_rows)
+        self._open_mapping_dialog(headers, rows)
 
-    def _open_mapping_dialog(self, csv_path: str, headers: List[str], sample_rows: List[List[str]]) -> None:
+    def _open_mapping_dialog(self, headers: List[str], rows: List[List[str]]) -> None:
         dialog = tk.Toplevel(self)
         dialog.title("Mapear columnas")
         dialog.grab_set()
@@ -186,10 +282,9 @@ class POSApp(tk.Tk):
         sample_frame = ttk.Labelframe(dialog, text="Vista previa")
         sample_frame.grid(row=len(field_labels) + 1, column=0, columnspan=2, sticky="nsew", padx=5, pady=5)
 
+        preview_text = "\n".join([", ".join(headers), *(", ".join(row) for row in rows[:3])])
         preview = tk.Text(sample_frame, width=60, height=6, state="normal")
-        preview.insert("1.0", ", ".join(headers) + "\n")
-        for row in sample_rows:
-            preview.insert("end", ", ".join(row) + "\n")
+        preview.insert("1.0", preview_text)
         preview.configure(state="disabled")
         preview.pack(fill="both", expand=True)
 
@@ -199,31 +294,33 @@ class POSApp(tk.Tk):
                 messagebox.showwarning("Importación", "Cada campo debe usar una columna diferente.")
                 return
             dialog.destroy()
-            self._import_products(csv_path, headers, selected)
+            self._import_products(headers, rows, selected)
 
         ttk.Button(dialog, text="Importar", command=confirm).grid(row=len(field_labels) + 2, column=0, columnspan=2, pady=5)
 
-    def _import_products(self, csv_path: str, headers: List[str], mapping: Dict[str, str]) -> None:
-        header_indices = {name: headers.index(col) for name, col in mapping.items()}
-        imported = 0
-        with open(csv_path, newline="", encoding="utf-8") as fh:
-            reader = csv.reader(fh)
-            next(reader)  # skip header
-            for row in reader:
-                try:
-                    product = Product(
-                        reference=row[header_indices["reference"]].strip(),
-                        description=row[header_indices["description"]].strip(),
-                        barcode=row[header_indices["barcode"]].strip(),
-                        price=float(row[header_indices["price"]].replace(",", ".")),
-                    )
-                except (IndexError, ValueError):
-                    continue
-                self.products.append(product)
-                imported += 1
-
+    def _import_products(self, headers: List[str], rows: List[List[str]], mapping: Dict[str, str]) -> None:
+        ref_idx = headers.index(mapping["reference"])
+        desc_idx = headers.index(mapping["description"])
+        bar_idx = headers.index(mapping["barcode"])
+        price_idx = headers.index(mapping["price"])
+        new_products: List[Product] = []
+        append = new_products.append
+        for row in rows:
+            try:
+                product = Product(
+                    reference=row[ref_idx].strip(),
+                    description=row[desc_idx].strip(),
+                    barcode=row[bar_idx].strip(),
+                    price=float(row[price_idx].replace(",", ".")),
+                )
+            except (IndexError, ValueError):
+                continue
+            append(product)
+        self.products.extend(new_products)
+        imported = len(new_products)
+
+        self._append_products(new_products)
         self._refresh_product_tree()
-        self._save_state()
         messagebox.showinfo("Importación", f"Productos importados: {imported}")
 
     # ---------- Sales ----------
@@ -240,27 +337,33 @@ class POSApp(tk.Tk):
             messagebox.showwarning("Venta", "La cantidad debe ser un número entero positivo.")
             return
 
-        item_id = selection[0]
-        idx = int(self.product_tree.index(item_id))
-        product = self.products[idx]
+        product = self.products[int(selection[0])]
         self.current_sale.append((product, qty))
-        self._refresh_sale_tree()
+        self._sale_total += self._append_sale_row(product, qty)
+        self._show_sale_total()
 
     def _refresh_sale_tree(self) -> None:
         for row in self.sale_tree.get_children():
             self.sale_tree.delete(row)
-        total = 0.0
-        for product, qty in self.current_sale:
-            line_total = product.price * qty
-            total += line_total
-            self.sale_tree.insert("", "end", values=(
-                product.reference,
-                product.description,
-                qty,
-                f"${product.price:,.2f}",
-                f"${line_total:,.2f}",
-            ))
-        self.sale_total_var.set(f"Total: ${total:,.2f}")
+        self._sale_total = sum(self._append_sale_row(product, qty) for product, qty in self.current_sale)
+        self._show_sale_total()
+
+    def _show_sale_total(self) -> None:
+        total_str = f"Total: ${self._sale_total:,.2f}"
+        if total_str != self._last_total_str:
+            self._last_total_str = total_str
+            self.sale_total_var.set(total_str)
+
+    def _append_sale_row(self, product: Product, qty: int) -> float:
+        line_total = product.price * qty
+        self.sale_tree.insert("", "end", values=(
+            product.reference,
+            product.description,
+            qty,
+            product.price_str,
+            f"${line_total:,.2f}",
+        ))
+        return line_total
 
     def finish_sale(self) -> None:
         if not self.cash_open:
@@ -269,12 +372,11 @@ class POSApp(tk.Tk):
         if not self.current_sale:
             messagebox.showinfo("Venta", "No hay productos en la venta actual.")
             return
-        sale_copy = list(self.current_sale)
-        self.session_sales.append(sale_copy)
-        self._print_ticket_for_sale(sale_copy)
+        sale = self.current_sale
         self.current_sale = []
+        self._add_to_session_totals(sale)
+        self._print_ticket_for_sale(sale)
         self._refresh_sale_tree()
-        messagebox.showinfo("Venta", "Venta registrada y ticket listo.")
 
     # ---------- Cash register ----------
     def open_cash(self) -> None:
@@ -282,7 +384,7 @@ class POSApp(tk.Tk):
             messagebox.showinfo("Caja", "La caja ya está abierta.")
             return
         self.cash_open = True
-        self.session_sales.clear()
+        self._reset_session_totals()
         self.cash_status_var.set("Abierta")
         self.cash_status_var_label_color("green")
 
@@ -296,33 +398,35 @@ class POSApp(tk.Tk):
             self._export_session_csv()
 
         summary_text = self._build_cash_summary()
-        self._print_text(summary_text)
-        messagebox.showinfo("Cierre", "Caja cerrada. Ticket de cierre listo.")
+        self._print_text(summary_text, ("Cierre", "Caja cerrada. Ticket de cierre listo."))
 
         self.cash_open = False
-        self.session_sales.clear()
+        self._reset_session_totals()
         self.cash_status_var.set("Cerrada")
         self.cash_status_var_label_color("red")
 
     def cash_status_var_label_color(self, color: str) -> None:
         self.cash_status_label.configure(foreground=color)
 
+    def _add_to_session_totals(self, sale: List[Tuple[Product, int]]) -> None:
+        for product, qty in sale:
+            self._session_qty[product.reference] += qty
+            self._session_total += product.price * qty
+
+    def _reset_session_totals(self) -> None:
+        self._session_qty = defaultdict(int)
+        self._session_total = 0.0
+
     def _build_cash_summary(self) -> str:
-        total = 0.0
-        aggregated: Dict[str, int] = {}
-        for sale in self.session_sales:
-            for product, qty in sale:
-                aggregated[product.reference] = aggregated.get(product.reference, 0) + qty
-                total += product.price * qty
         lines = ["*** Cierre de caja ***", datetime.now().strftime("%d/%m/%Y %H:%M"), ""]
-        for ref, qty in aggregated.items():
+        for ref, qty in self._session_qty.items():
             lines.append(f"{ref}: {qty} uds")
         lines.append("")
-        lines.append(f"Total caja: ${total:,.2f}")
+        lines.append(f"Total caja: ${self._session_total:,.2f}")
         return "\n".join(lines)
 
     def _export_session_csv(self) -> None:
-        if not self.session_sales:
+        if not self._session_qty:
             messagebox.showinfo("Exportación", "No hay ventas registradas en esta sesión.")
             return
         path = filedialog.asksaveasfilename(
@@ -332,14 +436,10 @@ class POSApp(tk.Tk):
         )
         if not path:
             return
-        aggregated: Dict[str, int] = {}
-        for sale in self.session_sales:
-            for product, qty in sale:
-                aggregated[product.reference] = aggregated.get(product.reference, 0) + qty
         with open(path, "w", newline="", encoding="utf-8") as fh:
             writer = csv.writer(fh)
             writer.writerow(["referencia", "numero_ventas"])
-            for ref, qty in aggregated.items():
+            for ref, qty in self._session_qty.items():
                 writer.writerow([ref, qty])
 
     # ---------- Printing ----------
@@ -349,30 +449,46 @@ class POSApp(tk.Tk):
         dialog.grab_set()
 
         ttk.Label(dialog, text="Impresora térmica (lpstat -p):").grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        printers = self._list_printers()
-        self.printer_var = tk.StringVar(value=self.printer_name or (printers[0] if printers else ""))
-        printer_combo = ttk.Combobox(dialog, textvariable=self.printer_var, values=printers)
+        self.printer_var = tk.StringVar(value=self.printer_name or "")
+        printer_combo = ttk.Combobox(dialog, textvariable=self.printer_var, values=[])
         printer_combo.grid(row=1, column=0, padx=5, pady=5, sticky="ew")
 
+        def fill_printers(future: Future) -> None:
+            if not dialog.winfo_exists():
+                return
+            printers = future.result()
+            printer_combo.configure(values=printers)
+            if printers and not self.printer_var.get():
+                self.printer_var.set(printers[0])
+
+        self._run_in_background(self._printer_pool, self._list_printers, fill_printers)
+
         ttk.Label(dialog, text="Si no aparece, escribe el nombre manualmente.").grid(row=2, column=0, padx=5, pady=5, sticky="w")
 
         def save_printer() -> None:
             self.printer_name = self.printer_var.get().strip() or None
-            self._save_state()
+            self._schedule_save()
             dialog.destroy()
 
         ttk.Button(dialog, text="Guardar", command=save_printer).grid(row=3, column=0, pady=5)
         dialog.columnconfigure(0, weight=1)
 
     def _list_printers(self) -> List[str]:
+        if self._printers_cache is not None:
+            fetched_at, cached = self._printers_cache
+            if time.monotonic() - fetched_at < PRINTERS_CACHE_TTL:
+                return cached
         try:
-            output = subprocess.check_output(["lpstat", "-p"], text=True)
+            output = subprocess.run(
+                ["lpstat", "-p"],
+                stdout=subprocess.PIPE,
+                text=True,
+                timeout=LPSTAT_TIMEOUT,
+            ).stdout
         except Exception:
-            return []
-        printers = []
-        for line in output.splitlines():
-            if line.startswith("printer "):
-                printers.append(line.split()[1])
+            output = ""
+        printers = [line.split()[1] for line in output.splitlines() if line.startswith("printer ")]
+        self._printers_cache = (time.monotonic(), printers)
         return printers
 
     def _print_ticket_for_sale(self, sale: List[Tuple[Product, int]]) -> None:
@@ -384,54 +500,140 @@ class POSApp(tk.Tk):
             lines.append(f"{product.reference} x{qty} - ${subtotal:,.2f}")
         lines.append("")
         lines.append(f"Total: ${total:,.2f}")
-        self._print_text("\n".join(lines))
+        self._print_text("\n".join(lines), ("Venta", "Venta registrada y ticket listo."))
+
+    def _print_text(self, text: str, confirmation: Optional[Tuple[str, str]] = None) -> None:
+        # confirmation is a (title, message) shown once the ticket has been handled.
+        printer_name = self.printer_name
+        self._run_in_background(
+            self._io_pool,
+            lambda: self._write_and_print(text, printer_name),
+            lambda future: self._on_print_done(future, printer_name, confirmation),
+        )
 
-    def _print_text(self, text: str) -> None:
+    def _write_and_print(self, text: str, printer_name: Optional[str]) -> str:
+        # Runs on the I/O pool: no Tk calls here.
         os.makedirs(TICKET_DIR, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         ticket_file = os.path.join(TICKET_DIR, f"ticket_{timestamp}.txt")
         with open(ticket_file, "w", encoding="utf-8") as fh:
             fh.write(text)
 
-        if not self.printer_name:
-            messagebox.showinfo("Impresión", "No hay impresora configurada. Se guardó el ticket en la carpeta 'tickets'.")
-            return
-
+        if not printer_name:
+            return ""
+        process = subprocess.run(
+            ["lpr", "-P", printer_name],
+            input=text,
+            text=True,
+            capture_output=True,
+            check=True,
+            timeout=LPR_TIMEOUT,
+        )
+        return process.stderr
+
+    def _on_print_done(
+        self,
+        future: Future,
+        printer_name: Optional[str],
+        confirmation: Optional[Tuple[str, str]],
+    ) -> None:
         try:
-            process = subprocess.run(
-                ["lpr", "-P", self.printer_name],
-                input=text,
-                text=True,
-                capture_output=True,
-                check=True,
-            )
-            if process.stderr:
-                messagebox.showwarning("Impresión", f"Impresora respondió: {process.stderr}")
+            stderr = future.result()
         except FileNotFoundError:
             messagebox.showwarning(
                 "Impresión",
                 "No se encontró el comando lpr. Se guardó el ticket en la carpeta 'tickets'.",
             )
+        except subprocess.TimeoutExpired:
+            messagebox.showerror(
+                "Impresión",
+                "La impresora no respondió a tiempo. Ticket guardado en 'tickets'.",
+            )
         except subprocess.CalledProcessError as err:
             messagebox.showerror(
                 "Impresión",
                 f"No se pudo enviar a la impresora. Ticket guardado en 'tickets'.\n{err.stderr}",
             )
+        else:
+            if not printer_name:
+                messagebox.showinfo("Impresión", "No hay impresora configurada. Se guardó el ticket en la carpeta 'tickets'.")
+            elif stderr:
+                messagebox.showwarning("Impresión", f"Impresora respondió: {stderr}")
+
+        if confirmation is not None:
+            messagebox.showinfo(*confirmation)
 
     # ---------- Helpers ----------
     def _refresh_product_tree(self) -> None:
-        for row in self.product_tree.get_children():
-            self.product_tree.delete(row)
-        for product in self.products:
-            self.product_tree.insert("", "end", values=(
+        if self._tree_fill_id is not None:
+            self.after_cancel(self._tree_fill_id)
+            self._tree_fill_id = None
+        self._fill_product_tree()
+
+    def _fill_product_tree(self) -> None:
+        # The catalog only grows, so rows already in the tree are kept and
+        # only the newly imported products are inserted, up to the current page.
+        # Rows go in batches so the event loop can repaint between them. Each
+        # row's iid is its index in self.products.
+        self._tree_fill_id = None
+        end = min(len(self.products), self._tree_limit)
+        stop = min(self._tree_rows + PRODUCT_BATCH_SIZE, end)
+        for idx, product in enumerate(self.products[self._tree_rows:stop], start=self._tree_rows):
+            self.product_tree.insert("", "end", iid=str(idx), values=(
                 product.reference,
                 product.description,
                 product.barcode,
-                f"${product.price:,.2f}",
+                product.price_str,
             ))
+        self._tree_rows = max(self._tree_rows, stop)
+        if stop < end:
+            self.products_frame.configure(text=f"Productos (cargando {stop}/{end})")
+            self._tree_fill_id = self.after_idle(self._fill_product_tree)
+        else:
+            self.products_frame.configure(text="Productos")
+
+    def _on_product_scroll(self, first: str, last: str) -> None:
+        self.prod_scroll.set(first, last)
+        if float(last) > 0.9 and self._tree_fill_id is None and self._tree_rows < len(self.products):
+            self._tree_limit += PRODUCT_PAGE_SIZE
+            self._refresh_product_tree()
+
+    def _run_in_background(
+        self,
+        pool: ThreadPoolExecutor,
+        func: Callable[[], object],
+        on_done: Callable[[Future], None],
+    ) -> None:
+        future = pool.submit(func)
+        self._pending_jobs += 1
+
+        def poll() -> None:
+            if future.done():
+                try:
+                    on_done(future)
+                finally:
+                    self._pending_jobs -= 1
+            else:
+                self.after(IO_POLL_MS, poll)
+
+        self.after(IO_POLL_MS, poll)
 
     def on_close(self) -> None:
+        if self._closing:
+            return
+        self._closing = True
         self._save_state()
+        self.withdraw()
+        self._finish_close()
+
+    def _finish_close(self) -> None:
+        # Keep the event loop running until pending tickets are written and
+        # their results shown; lpr and lpstat are both bounded by timeouts.
+        if self._pending_jobs:
+            self.after(IO_POLL_MS, self._finish_close)
+            return
+        self._io_pool.shutdown()
+        self._printer_pool.shutdown(wait=False, cancel_futures=True)
         self.destroy()
 
 